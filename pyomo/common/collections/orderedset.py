@@ -30,7 +30,8 @@ class OrderedSet(AutoSlots.Mixin, MutableSet):
         if isinstance(iterable, OrderedSet):
             self._dict.update(iterable._dict)
         else:
-            self._dict.update((val, None) for val in iterable)
+            # dict.fromkeys() builds the (ordered) keys in C
+            self._dict.update(dict.fromkeys(iterable))
 
     #
     # Implement MutableSet abstract methods
@@ -67,16 +68,63 @@ class OrderedSet(AutoSlots.Mixin, MutableSet):
         """Remove an element. If not a member, raise a KeyError."""
         del self._dict[val]
 
+    # OrderedSet is mutable (and therefore unhashable)
+    __hash__ = None
+
+    def __eq__(self, other):
+        # Equality (like the MutableSet default) ignores ordering
+        if isinstance(other, OrderedSet):
+            return self._dict.keys() == other._dict.keys()
+        if isinstance(other, (set, frozenset)):
+            return self._dict.keys() == other
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        if isinstance(other, OrderedSet):
+            return self._dict.keys() != other._dict.keys()
+        if isinstance(other, (set, frozenset)):
+            return self._dict.keys() != other
+        return super().__ne__(other)
+
     def intersection(self, other):
-        other = set(other)
-        res = OrderedSet(filter(other.__contains__, self))
+        if isinstance(other, OrderedSet):
+            other = other._dict
+        elif not isinstance(other, (set, frozenset, dict)):
+            other = set(other)
+        res = OrderedSet()
+        res._dict = dict.fromkeys(filter(other.__contains__, self._dict))
         return res
 
     def union(self, other):
-        res = OrderedSet(self)
+        res = OrderedSet()
+        res._dict = dict(self._dict)
         res.update(other)
         return res
 
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __iand__(self, other):
+        if isinstance(other, OrderedSet):
+            other = other._dict
+        elif not isinstance(other, (set, frozenset, dict)):
+            other = set(other)
+        self._dict = dict.fromkeys(filter(other.__contains__, self._dict))
+        return self
+
+    def __isub__(self, other):
+        if other is self:
+            self.clear()
+            return self
+        if isinstance(other, OrderedSet):
+            other = other._dict
+        _dict = self._dict
+        for val in other:
+            if val in _dict:
+                del _dict[val]
+        return self
+
     #
     # Not strictly part of MutableSet, but it makes sense that OrderedSet
     # should be reversible
@@ -22,16 +22,20 @@ import logging
 import functools
 import importlib
 import inspect
-import itertools
 import sys
 import textwrap
 import types
 import typing
 
+from collections import OrderedDict
+
 from pyomo.common.errors import DeveloperError
 from pyomo.common.flags import NOTSET, in_testing_environment, building_documentation
 
 _doc_flag = '.. deprecated::'
+# Cached reference to this module's globals() (used to recognize our
+# own frames when walking the stack in _find_calling_frame)
+_module_globals = globals()
 
 
 def _autosummary_doctest_setup():
@@ -52,15 +56,17 @@ def default_deprecation_msg(obj, user_msg, version, remove_in):
     See deprecated() function for argument details.
     """
     if user_msg is None:
-        if inspect.isclass(obj):
+        if obj is None:
+            # called from deprecation_warning()
+            _obj = ''
+        elif inspect.isclass(obj):
             _obj = ' class'
         elif inspect.ismethod(obj):
             _obj = ' method'
         elif inspect.isfunction(obj) or inspect.isbuiltin(obj):
             _obj = ' function'
         else:
-            # either @deprecated() an unknown type or called from
-            # deprecation_warning()
+            # @deprecated() an unknown type
             _obj = ''
 
         _qual = getattr(obj, '__qualname__', '') or ''
@@ -73,15 +79,44 @@ def default_deprecation_msg(obj, user_msg, version, remove_in):
             'This%s has been deprecated and may be removed in a '
             'future release.' % (_obj,)
         )
+    if version or remove_in:
+        return user_msg + _deprecation_comment(version, remove_in)
+    else:
+        return user_msg
+
+
+@functools.lru_cache(maxsize=256)
+def _deprecation_comment(version, remove_in):
+    # There are only a handful of distinct (version, remove_in) pairs,
+    # so we only need to build each suffix once
     comment = []
     if version:
         comment.append('deprecated in %s' % (version,))
     if remove_in:
         comment.append('will be removed in (or after) %s' % (remove_in))
-    if comment:
-        return user_msg + "  (%s)" % (', '.join(comment),)
-    else:
-        return user_msg
+    return "  (%s)" % (', '.join(comment),)
+
+
+def _format_deprecation_msg(msg):
+    msg = f'DEPRECATED: {msg}'
+    # Short messages that fill() would not change (no embedded tabs /
+    # newlines [which are not printable] and no trailing whitespace)
+    # can skip the (relatively expensive) TextWrapper entirely
+    if len(msg) <= 70 and msg.isprintable() and msg[-1] != ' ':
+        return msg
+    # Note: deprecation messages never need to be broken on hyphens,
+    # and disabling it lets TextWrapper use a much simpler regex
+    return textwrap.fill(msg, width=70, break_on_hyphens=False)
+
+
+def _cleandoc(doc):
+    if not doc:
+        return ''
+    # Single-line docstrings (without tabs) only need the leading
+    # whitespace removed: skip the general inspect.cleandoc() dedent
+    if '\n' not in doc and '\t' not in doc:
+        return doc.lstrip()
+    return inspect.cleandoc(doc)
 
 
 def _deprecation_docstring(obj, msg, version, remove_in):
@@ -92,12 +127,37 @@ def _deprecation_docstring(obj, msg, version, remove_in):
     # specified.
     if version is None:
         raise DeveloperError("@deprecated(): missing 'version' argument")
+    if msg is None:
+        # Resolve the (object-specific) default message here so that the
+        # cache below is keyed only on (hashable) strings
+        msg = default_deprecation_msg(obj, None, None, None)
+    return _cached_deprecation_docstring(msg, version, remove_in)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_deprecation_docstring(msg, version, remove_in):
     return (
         f'{_doc_flag} {version}\n'
-        f'   {default_deprecation_msg(obj, msg, None, remove_in)}\n'
+        f'   {default_deprecation_msg(None, msg, None, remove_in)}\n'
     )
 
 
+class _LazyDocstring:
+    """Descriptor that generates a class docstring on first access"""
+
+    __slots__ = ('_builder', '_doc')
+
+    def __init__(self, builder):
+        self._builder = builder
+        self._doc = None
+
+    def __get__(self, instance, owner=None):
+        if self._doc is None:
+            self._doc = self._builder()
+            self._builder = None
+        return self._doc
+
+
 def _wrap_class(cls, msg, logger, version, remove_in):
     _doc = None
     # Note: __new_member__ is where enum.Enum buries the user's original
@@ -112,10 +172,24 @@ def _wrap_class(cls, msg, logger, version, remove_in):
     # message.  Checking the fields above is still useful as it lets us know
     # if there is already a deprecation message on either new or init.
     if msg is not None or _doc is None:
-        _doc = _deprecation_docstring(cls, msg, version, remove_in)
-    if cls.__doc__:
-        _doc = inspect.cleandoc(cls.__doc__) + '\n\n' + _doc
-    cls.__doc__ = 'DEPRECATED.\n\n' + _doc
+        if version is None:
+            # Raise the error that _deprecation_docstring() would
+            # generate now (and not when the docstring is first used)
+            raise DeveloperError("@deprecated(): missing 'version' argument")
+        _doc = None
+    _cls_doc = cls.__doc__
+
+    def _build_doc():
+        doc = _doc
+        if doc is None:
+            doc = _deprecation_docstring(cls, msg, version, remove_in)
+        if _cls_doc:
+            doc = _cleandoc(_cls_doc) + '\n\n' + doc
+        return 'DEPRECATED.\n\n' + doc
+
+    # The docstring is only needed by help() / documentation: defer
+    # building it until it is first accessed
+    cls.__doc__ = _LazyDocstring(_build_doc)
 
     if _flagIdx < 0:
         # No deprecation message on __init__ or __new__: go through and
@@ -133,35 +207,53 @@ def _wrap_class(cls, msg, logger, version, remove_in):
 
 
 def _wrap_func(func, msg, logger, version, remove_in):
-    message = default_deprecation_msg(func, msg, version, remove_in)
+    # The message is fixed at decoration time: format it once here
+    # instead of every time the wrapped function is called.
+    message = _format_deprecation_msg(
+        default_deprecation_msg(func, msg, version, remove_in)
+    )
 
     @functools.wraps(
         func, assigned=('__module__', '__name__', '__qualname__', '__annotations__')
     )
     def wrapper(*args, **kwargs):
         cf = _find_calling_frame(1)
-        deprecation_warning(message, logger, version='', calling_frame=cf)
+        _emit_deprecation_warning(message, logger, cf)
         return func(*args, **kwargs)
 
     wrapper.__doc__ = 'DEPRECATED.\n\n'
-    _doc = inspect.cleandoc(func.__doc__ or '')
+    _doc = _cleandoc(func.__doc__)
     if _doc:
         wrapper.__doc__ += _doc + '\n\n'
     wrapper.__doc__ += _deprecation_docstring(func, msg, version, remove_in)
     return wrapper
 
 
-def _find_calling_frame(module_offset):
-    g = [globals()]
-    calling_frame = inspect.currentframe().f_back
+def _find_calling_frames(n):
+    """Return the first ``n`` frames where the module (globals) changes
+
+    Walking up the stack (starting outside this module), return the
+    first frame from a different module, then the first frame from a
+    module different from *that* one, etc.  Missing frames (if we run
+    off the top of the stack) are returned as None.
+
+    """
+    frames = []
+    g = _module_globals
+    calling_frame = sys._getframe(1)
     while calling_frame is not None:
-        if calling_frame.f_globals is g[-1]:
-            calling_frame = calling_frame.f_back
-        elif len(g) < module_offset:
-            g.append(calling_frame.f_globals)
-        else:
-            break
-    return calling_frame
+        if calling_frame.f_globals is not g:
+            frames.append(calling_frame)
+            if len(frames) == n:
+                return frames
+            g = calling_frame.f_globals
+        calling_frame = calling_frame.f_back
+    frames.extend([None] * (n - len(frames)))
+    return frames
+
+
+def _find_calling_frame(module_offset):
+    return _find_calling_frames(module_offset)[-1]
 
 
 def deprecation_warning(
@@ -200,13 +292,44 @@ def deprecation_warning(
     if version is None:
         raise DeveloperError("deprecation_warning() missing 'version' argument")
 
-    if logger is None:
-        if calling_frame is not None:
-            cf = calling_frame
-        else:
-            # The relevant module is the one that holds the
-            # function/method that called deprecation_warning
+    msg = _format_deprecation_msg(
+        default_deprecation_msg(None, msg, version, remove_in)
+    )
+    _emit_deprecation_warning(msg, logger, calling_frame)
+
+
+def _emit_deprecation_warning(msg, logger, calling_frame):
+    """Emit an already formatted deprecation message
+
+    See :func:`deprecation_warning` for argument details.
+    """
+    if calling_frame is None:
+        # The relevant module (for the logger) is the one that holds
+        # the function/method that called deprecation_warning.
+        #
+        # The useful thing to let the user know is what called the
+        # function that generated the deprecation warning.  The current
+        # globals() is *this* module.  Walking up the stack to find the
+        # frame where the globals() changes tells us the module that is
+        # issuing the deprecation warning.  As we assume that *that*
+        # module will not trigger its own deprecation warnings, we will
+        # walk farther up until the globals() changes again.
+        #
+        # Both frames are found in a single pass up the stack.
+        if (
+            deprecation_warning.report_call_site
+            or deprecation_warning.emitted_warnings is not None
+        ):
+            cf, calling_frame = _find_calling_frames(2)
+        elif logger is None:
+            # The call site is not reported (or needed to deduplicate
+            # warnings): we only need the frame to identify the logger
             cf = _find_calling_frame(1)
+        else:
+            cf = None
+    else:
+        cf = calling_frame
+    if logger is None:
         if cf is not None:
             logger = cf.f_globals.get('__name__', None)
             if logger is not None and not logger.startswith('pyomo'):
@@ -216,26 +339,27 @@ def deprecation_warning(
     if isinstance(logger, str):
         logger = logging.getLogger(logger)
 
-    msg = textwrap.fill(
-        f'DEPRECATED: {default_deprecation_msg(None, msg, version, remove_in)}',
-        width=70,
-    )
-    if calling_frame is None:
-        # The useful thing to let the user know is what called the
-        # function that generated the deprecation warning.  The current
-        # globals() is *this* module.  Walking up the stack to find the
-        # frame where the globals() changes tells us the module that is
-        # issuing the deprecation warning.  As we assume that *that*
-        # module will not trigger its own deprecation warnings, we will
-        # walk farther up until the globals() changes again.
-        calling_frame = _find_calling_frame(2)
     if calling_frame is not None:
-        info = inspect.getframeinfo(calling_frame)
-        msg += "\n(called from %s:%s)" % (info.filename.strip(), info.lineno)
-        if deprecation_warning.emitted_warnings is not None:
-            if msg in deprecation_warning.emitted_warnings:
+        # Note: inspect.getframeinfo() would also load the source
+        # context from disk; we only need the file name and line number
+        filename = calling_frame.f_code.co_filename.strip()
+        lineno = calling_frame.f_lineno
+        emitted = deprecation_warning.emitted_warnings
+        if emitted is not None:
+            # Key on the (unsuffixed) message and the call site.  This
+            # avoids building the full message for suppressed warnings,
+            # and (as messages from @deprecated are preformatted) usually
+            # reuses the cached string hash.
+            key = (msg, filename, lineno)
+            if key in emitted:
+                emitted.move_to_end(key)
                 return
-            deprecation_warning.emitted_warnings.add(msg)
+            emitted[key] = None
+            # Bound the cache (discarding the least recently seen
+            # warnings) so long-running processes do not leak memory
+            if len(emitted) > _MAX_EMITTED_WARNINGS:
+                emitted.popitem(last=False)
+        msg += "\n(called from %s:%s)" % (filename, lineno)
 
     logger.warning(msg)
 
@@ -244,10 +368,20 @@ def deprecation_warning(
 # testing or when we are building the documentation.  Note that doctest
 # doesn't set the "in_testing" flag until after pyomo.common is
 # imported.
+#
+# Setting report_call_site to False omits the "(called from ...)" suffix
+# (and skips the stack walk needed to generate it) when warnings are not
+# being deduplicated (emitted_warnings is None), unless the caller
+# explicitly provides the calling_frame.
+deprecation_warning.report_call_site = True
+#
+# emitted_warnings is used as an LRU cache (an OrderedDict mapping
+# warning keys to None) holding at most _MAX_EMITTED_WARNINGS entries.
+_MAX_EMITTED_WARNINGS = 1024
 if in_testing_environment() or building_documentation():
     deprecation_warning.emitted_warnings = None
 else:
-    deprecation_warning.emitted_warnings = set()
+    deprecation_warning.emitted_warnings = OrderedDict()
 
 
 def deprecated(msg=None, logger=None, version=None, remove_in=None):
@@ -299,7 +433,10 @@ def deprecated(msg=None, logger=None, version=None, remove_in=None):
 
 def _import_object(name, target, version, remove_in, msg):
     modname, targetname = target.rsplit('.', 1)
-    _object = getattr(importlib.import_module(modname), targetname)
+    mod = sys.modules.get(modname)
+    if mod is None:
+        mod = importlib.import_module(modname)
+    _object = getattr(mod, targetname)
     if msg is None:
         if inspect.isclass(_object):
             _type = 'class'
@@ -531,35 +668,44 @@ class RenamedClass(type):
                     "attribute" % (name,)
                 )
 
-        renamed_bases = []
-        for base in bases:
-            new_class = getattr(base, '__renamed__new_class__', None)
-            if new_class is not None:
-                base.__renamed__warning__(
-                    "Declaring class '%s' derived from '%s'." % (name, base.__name__)
-                )
-                base = new_class
-                # Flag that this class is derived from a renamed class
-                classdict.setdefault('__renamed__new_class__', None)
-            # Avoid duplicates (in case someone does a diamond between
-            # the renamed class and [a class derived from] the new
-            # class)
-            if base not in renamed_bases:
-                renamed_bases.append(base)
-
-        # Add the new class as a "base class" of the renamed class (this
-        # makes issubclass(renamed, new_class) work correctly).  As we
-        # still never create an actual instance of renamed, this doesn't
-        # affect the API)
-        if new_class is not None and new_class not in renamed_bases:
-            renamed_bases.append(new_class)
+        if new_class is None and not any(
+            '__renamed__new_class__' in vars(base) for base in bases
+        ):
+            # Fast path: neither this class nor any of its bases was
+            # renamed, so there is nothing to remap
+            renamed_bases = bases
+        else:
+            renamed_bases = []
+            for base in bases:
+                new_class = getattr(base, '__renamed__new_class__', None)
+                if new_class is not None:
+                    base.__renamed__warning__(
+                        "Declaring class '%s' derived from '%s'."
+                        % (name, base.__name__)
+                    )
+                    base = new_class
+                    # Flag that this class is derived from a renamed class
+                    classdict.setdefault('__renamed__new_class__', None)
+                # Avoid duplicates (in case someone does a diamond between
+                # the renamed class and [a class derived from] the new
+                # class)
+                if base not in renamed_bases:
+                    renamed_bases.append(base)
+
+            # Add the new class as a "base class" of the renamed class (this
+            # makes issubclass(renamed, new_class) work correctly).  As we
+            # still never create an actual instance of renamed, this doesn't
+            # affect the API)
+            if new_class is not None and new_class not in renamed_bases:
+                renamed_bases.append(new_class)
 
         if new_class is None and '__renamed__new_class__' not in classdict:
+            # Note: checking each class's own __dict__ over the
+            # (deduplicated) union of the base MROs is equivalent to (but
+            # cheaper than) hasattr() on every MRO entry
             if not any(
-                hasattr(mro, '__renamed__new_class__')
-                for mro in itertools.chain.from_iterable(
-                    base.__mro__ for base in renamed_bases
-                )
+                '__renamed__new_class__' in vars(mro)
+                for mro in set().union(*(base.__mro__ for base in renamed_bases))
             ):
                 raise TypeError(
                     "Declaring class '%s' using the RenamedClass metaclass, "
@@ -573,19 +719,26 @@ class RenamedClass(type):
 
     def __instancecheck__(cls, instance):
         # Note: the warning is issued by subclasscheck
-        return any(
-            cls.__subclasscheck__(c) for c in {type(instance), instance.__class__}
-        )
+        _type = type(instance)
+        if cls.__subclasscheck__(_type):
+            return True
+        # instance.__class__ can differ from type() (e.g., for proxies)
+        _class = instance.__class__
+        return _class is not _type and cls.__subclasscheck__(_class)
 
     def __subclasscheck__(cls, subclass):
-        if hasattr(cls, '__renamed__warning__'):
-            cls.__renamed__warning__(
-                "Checking type relative to '%s'." % (cls.__name__,)
-            )
+        # Note: we intentionally do not memoize the result: the warning
+        # must be issued for every check (it is deduplicated per call
+        # site by deprecation_warning), and issubclass() against the new
+        # class is already a fast (C-level) MRO scan.
+        _warning = getattr(cls, '__renamed__warning__', None)
+        if _warning is not None:
+            _warning("Checking type relative to '%s'." % (cls.__name__,))
         if subclass is cls:
             return True
-        elif getattr(cls, '__renamed__new_class__') is not None:
-            return issubclass(subclass, getattr(cls, '__renamed__new_class__'))
+        new_class = cls.__renamed__new_class__
+        if new_class is not None:
+            return issubclass(subclass, new_class)
         else:
             return super().__subclasscheck__(subclass)
 
@@ -605,19 +758,18 @@ class MovedModuleLoader:
         self._info = info
 
     def create_module(self, spec) -> types.ModuleType:
-        msg = self._info.msg
+        _, new_name, msg, logger, version, remove_in = self._info
         if msg is NOTSET:
             msg = (
-                f"The '{spec.name}' module has been moved to '{self._info.new_name}'. "
+                f"The '{spec.name}' module has been moved to '{new_name}'. "
                 'Please update your import.'
             )
         if msg is not None:
-            deprecation_warning(
-                msg, self._info.logger, self._info.version, self._info.remove_in
-            )
-        if self._info.new_name in sys.modules:
-            return sys.modules[self._info.new_name]
-        return importlib.import_module(self._info.new_name)
+            deprecation_warning(msg, logger, version, remove_in)
+        module = sys.modules.get(new_name, None)
+        if module is not None:
+            return module
+        return importlib.import_module(new_name)
 
     def exec_module(self, module: types.ModuleType) -> None:
         pass
@@ -643,10 +795,10 @@ class MovedModuleFinder:
     ":class:`dict` that maps (removed) module names to :class:`MovedModuleInfo` objects"
 
     def find_spec(self, fullname, path, target=None):
-        if fullname not in self.mapping:
+        info = MovedModuleFinder.mapping.get(fullname, None)
+        if info is None:
             return None
 
-        info = MovedModuleFinder.mapping[fullname]
         src_spec = importlib.util.find_spec(info.new_name)
         return importlib.machinery.ModuleSpec(
             name=fullname,
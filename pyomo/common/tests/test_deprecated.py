@@ -12,6 +12,8 @@
 import logging
 import sys
 
+from collections import OrderedDict
+
 from importlib import import_module
 from importlib.machinery import ModuleSpec
 from io import StringIO
@@ -29,6 +31,7 @@ from pyomo.common.deprecation import (
     MovedModuleLoader,
     RenamedClass,
     _import_object,
+    _MAX_EMITTED_WARNINGS,
 )
 from pyomo.common.log import LoggingIntercept
 
@@ -59,6 +62,106 @@ class TestDeprecated(unittest.TestCase):
             DEP_OUT.getvalue().replace('\n', ' '),
         )
 
+    def test_deprecation_warning_formatting(self):
+        # Short messages are not wrapped
+        DEP_OUT = StringIO()
+        with LoggingIntercept(DEP_OUT, 'pyomo'):
+            deprecation_warning("short message", version='1.2')
+        self.assertEqual(
+            DEP_OUT.getvalue().splitlines()[0],
+            'DEPRECATED: short message  (deprecated in 1.2)',
+        )
+
+        # ...but embedded whitespace is still normalized
+        DEP_OUT = StringIO()
+        with LoggingIntercept(DEP_OUT, 'pyomo'):
+            deprecation_warning("short\nmessage", version='1.2')
+        self.assertEqual(
+            DEP_OUT.getvalue().splitlines()[0],
+            'DEPRECATED: short message  (deprecated in 1.2)',
+        )
+
+        # Long messages are wrapped (but not on hyphens)
+        DEP_OUT = StringIO()
+        with LoggingIntercept(DEP_OUT, 'pyomo'):
+            deprecation_warning(
+                "a rather long message that needs to be wrapped at a non-hyphen",
+                version='1.2',
+            )
+        self.assertEqual(
+            DEP_OUT.getvalue().splitlines()[:2],
+            [
+                'DEPRECATED: a rather long message that needs to be wrapped at a',
+                'non-hyphen  (deprecated in 1.2)',
+            ],
+        )
+
+    def test_emitted_warnings(self):
+        orig = deprecation_warning.emitted_warnings
+        try:
+            deprecation_warning.emitted_warnings = OrderedDict()
+            DEP_OUT = StringIO()
+            with LoggingIntercept(DEP_OUT, 'pyomo'):
+                for i in range(3):
+                    deprecation_warning("repeated message", version='1.2')
+                deprecation_warning("another message", version='1.2')
+            self.assertEqual(DEP_OUT.getvalue().count('repeated message'), 1)
+            self.assertEqual(DEP_OUT.getvalue().count('another message'), 1)
+            self.assertEqual(len(deprecation_warning.emitted_warnings), 2)
+
+            # The cache is bounded (least recently used warnings are
+            # discarded first)
+            DEP_OUT = StringIO()
+            with LoggingIntercept(DEP_OUT, 'pyomo'):
+                deprecation_warning("repeated message", version='1.2')
+                for i in range(_MAX_EMITTED_WARNINGS - 1):
+                    deprecation_warning(f"message {i}", version='1.2')
+            self.assertEqual(
+                len(deprecation_warning.emitted_warnings), _MAX_EMITTED_WARNINGS
+            )
+            self.assertNotIn('another message', DEP_OUT.getvalue())
+            self.assertNotIn('repeated message', DEP_OUT.getvalue())
+            DEP_OUT = StringIO()
+            with LoggingIntercept(DEP_OUT, 'pyomo'):
+                deprecation_warning("repeated message", version='1.2')
+                deprecation_warning("another message", version='1.2')
+            self.assertNotIn('repeated message', DEP_OUT.getvalue())
+            self.assertIn('another message', DEP_OUT.getvalue())
+        finally:
+            deprecation_warning.emitted_warnings = orig
+
+    def test_report_call_site(self):
+        orig = (
+            deprecation_warning.report_call_site,
+            deprecation_warning.emitted_warnings,
+        )
+        try:
+            deprecation_warning.emitted_warnings = None
+            DEP_OUT = StringIO()
+            with LoggingIntercept(DEP_OUT, 'local'):
+                deprecation_warning("message", logger='local', version='1.2')
+            self.assertIn('(called from ', DEP_OUT.getvalue())
+
+            deprecation_warning.report_call_site = False
+            DEP_OUT = StringIO()
+            with LoggingIntercept(DEP_OUT, 'local'):
+                deprecation_warning("message", logger='local', version='1.2')
+            self.assertEqual(
+                DEP_OUT.getvalue(), "DEPRECATED: message  (deprecated in 1.2)\n"
+            )
+
+            # The call site is still needed to deduplicate warnings
+            deprecation_warning.emitted_warnings = OrderedDict()
+            DEP_OUT = StringIO()
+            with LoggingIntercept(DEP_OUT, 'local'):
+                deprecation_warning("message", logger='local', version='1.2')
+            self.assertIn('(called from ', DEP_OUT.getvalue())
+        finally:
+            (
+                deprecation_warning.report_call_site,
+                deprecation_warning.emitted_warnings,
+            ) = orig
+
     def test_no_version_exception(self):
         with self.assertRaisesRegex(
             DeveloperError, r"@deprecated\(\): missing 'version' argument"
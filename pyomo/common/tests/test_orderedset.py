@@ -26,6 +26,24 @@ class testOrderedSet(unittest.TestCase):
         self.assertEqual(list(a), ref)
         self.assertEqual(str(a), "OrderedSet(1, 9, 'a', 4, 2, None)")
 
+    def test_update(self):
+        a = OrderedSet([1, 2])
+        # small (sized) iterable
+        a.update([3, 1, 4])
+        self.assertEqual(list(a), [1, 2, 3, 4])
+        # large iterable with duplicates
+        a.update([5, 2, 6, 7, 5, 8, 9, 10, 11, 1, 12])
+        self.assertEqual(list(a), list(range(1, 13)))
+        # unsized iterable
+        a.update(i for i in range(14, 10, -1))
+        self.assertEqual(list(a), list(range(1, 13)) + [14, 13])
+        # OrderedSet
+        a.update(OrderedSet([16, 3, 15]))
+        self.assertEqual(list(a), list(range(1, 13)) + [14, 13, 16, 15])
+
+        a = OrderedSet(range(10, 0, -1))
+        self.assertEqual(list(a), list(range(10, 0, -1)))
+
     def test_in_add(self):
         a = OrderedSet()
         self.assertNotIn(1, a)
@@ -61,6 +79,35 @@ class testOrderedSet(unittest.TestCase):
         a.clear()
         self.assertEqual(list(a), [])
 
+    def test_discard_readd(self):
+        a = OrderedSet([1, 3, 2, 4])
+        a.discard(3)
+        a.add(3)
+        a.discard(1)
+        self.assertEqual(list(a), [2, 4, 3])
+        self.assertEqual(list(reversed(a)), [3, 4, 2])
+        a.add(1)
+        a.discard(3)
+        a.add(3)
+        self.assertEqual(len(a), 4)
+        self.assertEqual(list(a), [2, 4, 1, 3])
+
+    def test_eq(self):
+        a = OrderedSet([1, 2, 3])
+        self.assertEqual(a, a)
+        self.assertEqual(a, OrderedSet([3, 2, 1]))
+        self.assertEqual(a, {1, 2, 3})
+        self.assertEqual(a, frozenset([1, 2, 3]))
+        self.assertEqual(a, {1: None, 2: None, 3: None}.keys())
+        self.assertNotEqual(a, OrderedSet([1, 2]))
+        self.assertNotEqual(a, OrderedSet([1, 2, 4]))
+        self.assertNotEqual(a, {1, 2, 3, 4})
+        self.assertNotEqual(a, [1, 2, 3])
+        self.assertFalse(a != OrderedSet([2, 3, 1]))
+        self.assertFalse(a == [1, 2, 3])
+        with self.assertRaisesRegex(TypeError, 'unhashable'):
+            hash(a)
+
     def test_pickle(self):
         ref = [1, 9, 'a', 4, 2, None]
         a = OrderedSet(ref)
@@ -77,6 +124,29 @@ class testOrderedSet(unittest.TestCase):
         self.assertEqual(list(a), [1, 2, 3, 'a', 'b', 'c'])
         self.assertEqual(list(b), [3, 4, 'c', 'd'])
 
+    def test_inplace_operators(self):
+        a = OrderedSet([1, 2, 3, 'a', 'b', 'c'])
+        ref = a
+        a |= OrderedSet([3, 4, 'c', 'd'])
+        self.assertIs(a, ref)
+        self.assertEqual(list(a), [1, 2, 3, 'a', 'b', 'c', 4, 'd'])
+
+        a &= OrderedSet([4, 'a', 1, 'x'])
+        self.assertIs(a, ref)
+        self.assertEqual(list(a), [1, 'a', 4])
+
+        a |= [5, 6]
+        a -= OrderedSet([1, 6, 'y'])
+        self.assertIs(a, ref)
+        self.assertEqual(list(a), ['a', 4, 5])
+
+        a &= {5, 'a'}
+        self.assertEqual(list(a), ['a', 5])
+
+        a -= a
+        self.assertIs(a, ref)
+        self.assertEqual(list(a), [])
+
     def test_intersection(self):
         a = OrderedSet([1, 2, 3, 'a', 'b', 'c'])
         b = OrderedSet([3, 4, 'c', 'd'])
@@ -85,6 +155,14 @@ class testOrderedSet(unittest.TestCase):
         self.assertEqual(list(a), [1, 2, 3, 'a', 'b', 'c'])
         self.assertEqual(list(b), [3, 4, 'c', 'd'])
 
+        self.assertEqual(list(a.intersection(['c', 'x', 1])), [1, 'c'])
+        self.assertEqual(list(a.intersection({'b': 0, 2: 1})), [2, 'b'])
+        self.assertEqual(list(a.intersection(frozenset([3, 2]))), [2, 3])
+        c = a.intersection(range(10, 20))
+        self.assertEqual(list(c), [])
+        c.add(5)
+        self.assertEqual(list(c), [5])
+
     def test_reversed(self):
         a = OrderedSet([1, 5, 3])
         self.assertEqual(list(a), [1, 5, 3])
@@ -371,8 +371,8 @@ Constructing component 'q' from data=None failed:
         with LoggingIntercept() as LOG:
             m.con.rule = new_rule
         self.assertIn(
-            "DEPRECATED: The 'LogicalConstraint.rule' attribute will be made "
-            "read-\nonly",
+            "DEPRECATED: The 'LogicalConstraint.rule' attribute will be made\n"
+            "read-only",
             LOG.getvalue(),
         )
         self.assertIs(m.con.rule, new_rule)
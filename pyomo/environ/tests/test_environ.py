@@ -10,14 +10,56 @@
 # Unit Tests for pyomo.base.misc
 #
 
+import heapq
 import math
 import os
-import re
-import sys
 import subprocess
+import sys
 
 import pyomo.common.unittest as unittest
 
+# The (known) worst offenders for test_tpl_import_time.  The following are
+# modules from the "standard" library.  Their order in the list
+# of slow-loading TPLs can vary from platform to platform.
+_TPL_REF = frozenset(
+    {
+        '__future__',
+        'argparse',
+        'ast',  # Imported on Windows
+        'backports_abc',  # Imported by cython on Linux
+        'base64',  # Imported on Windows
+        'bisect',  # Imported by dae, dataportal, contrib/mpc
+        'cPickle',
+        'copy',  # Imported by ply, et al.
+        'csv',
+        'ctypes',  # mandatory import in core/base/external.py; TODO: fix this
+        'datetime',  # imported by contrib.solver
+        'decimal',
+        'encodings',  # We tabulate modules imported by python
+        'gc',  # Imported on MacOS, Windows; Linux in 3.10
+        'glob',
+        'heapq',  # Added in Python 3.10
+        'importlib',
+        'inspect',
+        'io',
+        'json',  # Imported on Windows
+        'locale',  # Added in Python 3.9
+        'logging',
+        'pickle',
+        'platform',
+        'shlex',
+        'socket',  # Imported on MacOS, Windows; Linux in 3.10
+        'subprocess',
+        'tempfile',  # Imported on MacOS, Windows
+        'textwrap',
+        'typing',
+        'win32file',  # Imported on Windows
+        'win32pipe',  # Imported on Windows
+    }
+)
+# Non-standard-library TPLs that Pyomo will load unconditionally:
+# _TPL_REF |= {'ply'}  # PLY removed as a dependency in 6.10.0
+
 
 class ImportData:
     def __init__(self):
@@ -52,27 +94,32 @@ def collect_import_time(module, preimport=""):
     )
     # Note: test only runs in PY3
     output = output.decode()
-    line_re = re.compile(r'.*:\s*(\d+) \|\s*(\d+) \| ( *)([^ ]+)')
-    header_re = re.compile(r'.*:\s*(.*)')
+    # Each line has the (fixed) format
+    #   "import time: <self> | <cumulative> | <indent><module>"
+    # and the report(s) start with a header line in the same format.
     results = []
     data = None
     for line in output.splitlines():
-        g = line_re.match(line)
-        if not g:
-            g = header_re.match(line)
-            if g:
-                data = []
-                results.append(data)
-            else:
-                raise RuntimeError(f"Unrecognized line: '{line}'")
+        _, sep, rest = line.rpartition(':')
+        if not sep:
+            raise RuntimeError(f"Unrecognized line: '{line}'")
+        _self, _, rest = rest.partition('|')
+        _cumul, _, rest = rest.partition('|')
+        try:
+            _self = int(_self)
+            _cumul = int(_cumul)
+        except ValueError:
+            # Header line
+            data = []
+            results.append(data)
             continue
-        _self = int(g.group(1))
-        _cumul = int(g.group(2))
-        _level = len(g.group(3)) // 2
-        _module = g.group(4)
+        _module = rest.lstrip(' ')
+        # Note: there is a single space between the '|' and the indent
+        _level = (len(rest) - len(_module) - 1) // 2
+        _module = _module.split(' ', 1)[0]
         # print("%6d %8d %2d %s" % (_self, _cumul, _level, _module))
-        while len(data) < _level + 1:
-            data.append(ImportData())
+        if len(data) < _level + 1:
+            data.extend(ImportData() for _ in range(_level + 1 - len(data)))
         if len(data) > _level + 1:
             if len(data) != _level + 2:
                 raise RuntimeError(
@@ -80,7 +127,7 @@ def collect_import_time(module, preimport=""):
                 )
             inner = data.pop()
             inner.tpl = {
-                (k if '(from' in k else "%s (from %s)" % (k, _module), v)
+                (k if '(from' in k else f"{k} (from {_module})"): v
                 for k, v in inner.tpl.items()
             }
             if _module.startswith(basemodule):
@@ -112,25 +159,16 @@ def summarize_import_time(module, data, raw_output):
 
     modname = module.split('.')[0]
 
-    N = int(math.log10(max(max(data.module.values()), max(data.tpl.values())))) + 4
-    print(f"{modname.title()} (by module time):")
-    print(
-        "\n".join(
-            f"%{N}d: %s" % (v, k)
-            for k, v in sorted(data.module.items(), key=lambda x: x[1])
-        )
-    )
-    tpls = sorted(
-        (*_mod.split(' ', maxsplit=1), '', _time) for _mod, _time in data.tpl.items()
-    )
-    print("TPLS:")
-    _line_fmt = f"   %{max(len(l[0]) for l in tpls)}s: %6d %s"
-    print("\n".join(_line_fmt % (l[0], l[-1], l[1]) for l in tpls))
+    # Split each TPL key ("module (from importer)") once
+    tpls = []
+    for _key, _time in data.tpl.items():
+        _mod, _sep, _from = _key.partition(' ')
+        tpls.append((_mod, _from, _time, 1 if _sep else 2))
     tpl = {}
-    for k, v in data.tpl.items():
-        _mod = k.split()[0].split('.')[0]
+    for _mod, _from, _time, _cat in tpls:
+        _mod = _mod.split('.', 1)[0]
         _base_time, _base_cat = tpl.get(_mod, (0, 0))
-        tpl[_mod] = _base_time + v, _base_cat | (1 if ' ' in k else 2)
+        tpl[_mod] = _base_time + _time, _base_cat | _cat
     tpl_by_time = sorted(tpl.items(), key=lambda x: x[1])
 
     pyomo_time = sum(data.module.values())
@@ -140,6 +178,19 @@ def summarize_import_time(module, data, raw_output):
     module_tpl_time = sum(t for m, (t, s) in tpl_by_time if s & 1)
     assert abs(python_time + module_tpl_time - tpl_time) < 1
 
+    N = int(math.log10(max(max(data.module.values()), max(data.tpl.values())))) + 4
+    print(f"{modname.title()} (by module time):")
+    print(
+        "\n".join(
+            f"%{N}d: %s" % (v, k)
+            for k, v in sorted(data.module.items(), key=lambda x: x[1])
+        )
+    )
+    tpls.sort()
+    print("TPLS:")
+    _line_fmt = f"   %{max(len(l[0]) for l in tpls)}s: %6d %s"
+    print("\n".join(_line_fmt % (l[0], l[2], l[1]) for l in tpls))
+
     print("TPLS (by package time):")
     _line_fmt = f"   %{max(len(k) for k in tpl)}s: %6d (%4.1f%%)%s"
     source = {1: '', 2: ' *', 3: ' *+'}
@@ -205,48 +256,13 @@ class TestPyomoEnviron(unittest.TestCase):
         # value (at time of writing, TPL imports were 52-57% of the
         # import time on a development machine)
         self.assertLess(module_tpl_time / (module_tpl_time + pyomo_time), 0.33)
-        # Spot-check the (known) worst offenders.  The following are
-        # modules from the "standard" library.  Their order in the list
-        # of slow-loading TPLs can vary from platform to platform.
-        ref = {
-            '__future__',
-            'argparse',
-            'ast',  # Imported on Windows
-            'backports_abc',  # Imported by cython on Linux
-            'base64',  # Imported on Windows
-            'bisect',  # Imported by dae, dataportal, contrib/mpc
-            'cPickle',
-            'copy',  # Imported by ply, et al.
-            'csv',
-            'ctypes',  # mandatory import in core/base/external.py; TODO: fix this
-            'datetime',  # imported by contrib.solver
-            'decimal',
-            'encodings',  # We tabulate modules imported by python
-            'gc',  # Imported on MacOS, Windows; Linux in 3.10
-            'glob',
-            'heapq',  # Added in Python 3.10
-            'importlib',
-            'inspect',
-            'io',
-            'json',  # Imported on Windows
-            'locale',  # Added in Python 3.9
-            'logging',
-            'pickle',
-            'platform',
-            'shlex',
-            'socket',  # Imported on MacOS, Windows; Linux in 3.10
-            'subprocess',
-            'tempfile',  # Imported on MacOS, Windows
-            'textwrap',
-            'typing',
-            'win32file',  # Imported on Windows
-            'win32pipe',  # Imported on Windows
-        }
-        # Non-standard-library TPLs that Pyomo will load unconditionally:
-        # ref.add('ply')  # PLY removed as a dependency in 6.10.0
-        diff = set(_[0] for _ in tpl_by_time[-5:]).difference(ref)
+        # Spot-check the (known) worst offenders
+        slowest = heapq.nlargest(5, tpl_by_time, key=lambda x: x[1])
+        diff = {m for m, _ in slowest} - _TPL_REF
         self.assertEqual(
-            diff, set(), "Unexpected module found in 5 slowest-loading TPL modules"
+            diff,
+            set(),
+            "Unexpected module found in 5 slowest-loading TPL modules: %s" % (slowest,),
         )
 
 
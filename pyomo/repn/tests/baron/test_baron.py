@@ -11,8 +11,9 @@
 #
 
 import os
-from filecmp import cmp
+from functools import reduce
 from io import StringIO
+from operator import mul
 
 import pyomo.common.unittest as unittest
 from pyomo.common.collections import OrderedSet
@@ -54,33 +55,30 @@ class Test(unittest.TestCase):
         self._cleanup(test_fname)
         io_options = {"symbolic_solver_labels": True}
         io_options.update(kwds)
-        model.write(test_fname, format="bar", io_options=io_options)
-        try:
-            self.assertTrue(cmp(test_fname, baseline_fname))
-        except:
-            with open(baseline_fname, 'r') as f1, open(test_fname, 'r') as f2:
-                f1_contents = f1.read().replace(' ;', ';').split()
-                f2_contents = f2.read().replace(' ;', ';').split()
-                self.assertEqual(
-                    f1_contents,
-                    f2_contents,
-                    "\n\nbaseline: %s\ntestFile: %s\n" % (baseline_fname, test_fname),
-                )
-        self._cleanup(test_fname)
+        OUT = StringIO()
+        model.write(OUT, format="bar", io_options=io_options)
+        test_contents = OUT.getvalue()
+        with open(baseline_fname, 'r') as f:
+            baseline_contents = f.read()
+        if test_contents == baseline_contents:
+            return
+        baseline_contents = baseline_contents.replace(' ;', ';').split()
+        test_contents = test_contents.replace(' ;', ';').split()
+        if baseline_contents != test_contents:
+            # Only write the output to disk on failure (for inspection,
+            # or to update the baseline)
+            with open(test_fname, 'w') as f:
+                f.write(OUT.getvalue())
+            self.assertEqual(
+                baseline_contents,
+                test_contents,
+                "\n\nbaseline: %s\ntestFile: %s\n" % (baseline_fname, test_fname),
+            )
 
     def _gen_expression(self, terms):
-        terms = list(terms)
-        expr = 0.0
-        for term in terms:
-            if type(term) is tuple:
-                prodterms = list(term)
-                prodexpr = 1.0
-                for x in prodterms:
-                    prodexpr *= x
-                expr += prodexpr
-            else:
-                expr += term
-        return expr
+        return sum(
+            reduce(mul, term, 1.0) if type(term) is tuple else term for term in terms
+        )
 
     def test_no_column_ordering_quadratic(self):
         model = ConcreteModel()
@@ -99,8 +97,9 @@ class Test(unittest.TestCase):
             (model.a, model.c),
             (model.b, model.c),
         ]
-        model.obj = Objective(expr=self._gen_expression(terms))
-        model.con = Constraint(expr=self._gen_expression(terms) <= 1)
+        expr = self._gen_expression(terms)
+        model.obj = Objective(expr=expr)
+        model.con = Constraint(expr=expr <= 1)
         self._check_baseline(model)
 
     def test_no_column_ordering_linear(self):
@@ -110,8 +109,9 @@ class Test(unittest.TestCase):
         model.c = Var()
 
         terms = [model.a, model.b, model.c]
-        model.obj = Objective(expr=self._gen_expression(terms))
-        model.con = Constraint(expr=self._gen_expression(terms) <= 1)
+        expr = self._gen_expression(terms)
+        model.obj = Objective(expr=expr)
+        model.con = Constraint(expr=expr <= 1)
         self._check_baseline(model)
 
     def test_no_row_ordering(self):
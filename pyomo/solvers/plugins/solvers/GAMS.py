@@ -7,6 +7,8 @@
 # software.  This software is distributed under the 3-clause BSD License.
 # ____________________________________________________________________________________
 
+import ast
+import functools
 from io import StringIO
 import shlex
 from tempfile import mkdtemp
@@ -19,11 +21,11 @@ import pyomo.common
 from pyomo.common.dependencies import pathlib
 from pyomo.common.collections import Bunch
 from pyomo.common.tee import TeeStream
+from pyomo.common.tempfiles import TempfileManager
 
 from pyomo.opt.base.solvers import _extract_version
 
 from pyomo.core.kernel.block import IBlock
-from pyomo.core.kernel.objective import IObjective
 from pyomo.core.kernel.variable import IVariable
 
 import pyomo.core.base.suffix
@@ -59,9 +61,100 @@ def _gams_importer():
 
 
 gdxcc, gdxcc_available = attempt_import('gdxcc', importer=_gams_importer)
+gams, gams_available = attempt_import('gams')
 
 logger = logging.getLogger('pyomo.solvers')
 
+# Placeholder (level, marginal) record for symbols GAMS returned no
+# solution for
+_NAN_PAIR = (float('nan'), float('nan'))
+
+# Model / solve statistics the GAMS writer exports after the solve, and
+# the subset of them that are real-valued (the rest are integer codes
+# or counts)
+_STAT_VAR_NAMES = (
+    'MODELSTAT',
+    'SOLVESTAT',
+    'OBJEST',
+    'OBJVAL',
+    'NUMVAR',
+    'NUMEQU',
+    'NUMDVAR',
+    'NUMNZ',
+    'ETSOLVE',
+)
+_FLOAT_STAT_VARS = frozenset(('OBJEST', 'OBJVAL', 'ETSOLVE'))
+
+# Solver status (and, if known, termination condition) for each GAMS
+# solve status code (SOLVESTAT)
+_SOLVESTAT_MAP = {
+    1: (SolverStatus.ok, None),
+    2: (SolverStatus.ok, TerminationCondition.maxIterations),
+    3: (SolverStatus.ok, TerminationCondition.maxTimeLimit),
+    4: (SolverStatus.warning, None),
+    5: (SolverStatus.ok, TerminationCondition.maxEvaluations),
+    6: (SolverStatus.unknown, None),
+    7: (SolverStatus.aborted, TerminationCondition.licensingProblems),
+    8: (SolverStatus.aborted, TerminationCondition.userInterrupt),
+    9: (SolverStatus.error, None),
+    10: (SolverStatus.error, TerminationCondition.solverFailure),
+    11: (SolverStatus.error, TerminationCondition.internalSolverError),
+    12: (SolverStatus.error, None),
+    13: (SolverStatus.error, None),
+}
+
+# Termination condition and solution status for each GAMS model status
+# code (MODELSTAT).  The last entry flags termination conditions that
+# should only be set if the solve status did not already set one.
+_MODELSTAT_MAP = {
+    1: (TerminationCondition.optimal, SolutionStatus.optimal, False),
+    2: (TerminationCondition.locallyOptimal, SolutionStatus.locallyOptimal, False),
+    3: (TerminationCondition.unbounded, SolutionStatus.unbounded, False),
+    4: (TerminationCondition.infeasible, SolutionStatus.infeasible, False),
+    5: (TerminationCondition.infeasible, SolutionStatus.infeasible, False),
+    6: (TerminationCondition.infeasible, SolutionStatus.infeasible, False),
+    7: (TerminationCondition.feasible, SolutionStatus.feasible, False),
+    # 'Integer solution model found'
+    8: (TerminationCondition.optimal, SolutionStatus.optimal, False),
+    9: (TerminationCondition.intermediateNonInteger, SolutionStatus.other, False),
+    10: (TerminationCondition.infeasible, SolutionStatus.infeasible, False),
+    # Should be handled by SOLVESTAT, if modelstat and solvestat both
+    # indicate a licensing problem
+    11: (TerminationCondition.licensingProblems, SolutionStatus.error, True),
+    12: (TerminationCondition.error, SolutionStatus.error, True),
+    13: (TerminationCondition.error, SolutionStatus.error, True),
+    14: (TerminationCondition.noSolution, SolutionStatus.unknown, True),
+    # 15-17 have to do with CNS models, not sure what to make of
+    # status descriptions
+    15: (TerminationCondition.optimal, SolutionStatus.unsure, False),
+    16: (TerminationCondition.optimal, SolutionStatus.unsure, False),
+    17: (TerminationCondition.optimal, SolutionStatus.unsure, False),
+    18: (TerminationCondition.unbounded, SolutionStatus.unbounded, False),
+    19: (TerminationCondition.infeasible, SolutionStatus.infeasible, False),
+}
+
+
+def _set_solver_status(results, solvestat):
+    status = _SOLVESTAT_MAP.get(solvestat, None)
+    if status is None:
+        return
+    results.solver.status, tc = status
+    if tc is not None:
+        results.solver.termination_condition = tc
+    if solvestat == 4:
+        results.solver.message = "Solver quit with a problem (see LST file)"
+
+
+def _set_model_status(results, soln, modelstat):
+    status = _MODELSTAT_MAP.get(modelstat, None)
+    if status is None:
+        # This is just a backup catch, all known codes are in the map
+        soln.status = SolutionStatus.error
+        return
+    tc, soln.status, only_if_unset = status
+    if not only_if_unset or results.solver.termination_condition is None:
+        results.solver.termination_condition = tc
+
 
 class _GAMSSolver:
     """Aggregate of common methods for GAMS interfaces"""
@@ -70,6 +163,12 @@ class _GAMSSolver:
         self._version = None
         self._default_variable_value = None
         self._metasolver = False
+        # Trivial availability / license test models (each of which
+        # requires a full GAMS run) that this instance solved
+        # successfully.  Failed probes are not recorded (and are re-run
+        # on the next call), so installing GAMS or a license is picked
+        # up without creating a new solver.
+        self._solved_simple_models = set()
 
         self._capabilities = Bunch()
         self._capabilities.linear = True
@@ -108,7 +207,7 @@ class _GAMSSolver:
         if not istr:
             return ans
         if istr[0] == "'" or istr[0] == '"':
-            istr = eval(istr)
+            istr = ast.literal_eval(istr)
         tokens = shlex.split(istr)
         for token in tokens:
             index = token.find('=')
@@ -116,14 +215,18 @@ class _GAMSSolver:
                 raise ValueError(
                     "Solver options must have the form option=value: '%s'" % istr
                 )
+            # Only (numeric, etc.) literals are converted: anything
+            # else is passed through as a string
             try:
-                val = eval(token[(index + 1) :])
+                val = ast.literal_eval(token[(index + 1) :])
             except:
                 val = token[(index + 1) :]
             ans[token[:index]] = val
         return ans
 
-    def _simple_model(self, n):
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _simple_model(n):
         return """
             option limrow = 0;
             option limcol = 0;
@@ -185,15 +288,13 @@ class GAMSDirect(_GAMSSolver):
 
     def available(self, exception_flag=True):
         """True if the solver is available."""
-        try:
-            from gams import GamsWorkspace, DebugLevel
-        except ImportError as e:
+        if not gams_available:
             if not exception_flag:
                 return False
             raise ImportError(
                 "Import of gams failed - GAMS direct "
                 "solver functionality is not available.\n"
-                "GAMS message: %s" % (e,)
+                "GAMS message: %s" % (gams._moduleunavailable_message(),)
             )
         avail = self._run_simple_model(1)
         if not avail and exception_flag:
@@ -211,20 +312,26 @@ class GAMSDirect(_GAMSSolver):
         """Returns a tuple describing the solver executable version."""
         if not self.available(exception_flag=False):
             return _extract_version('')
-        from gams import GamsWorkspace
-
-        workspace = GamsWorkspace()
+        workspace = gams.GamsWorkspace()
         version = tuple(int(i) for i in workspace._version.split('.')[:4])
         while len(version) < 4:
             version += (0,)
         return version
 
     def _run_simple_model(self, n):
+        if n in self._solved_simple_models:
+            return True
+        if not self._solve_simple_model(n):
+            return False
+        self._solved_simple_models.add(n)
+        return True
+
+    def _solve_simple_model(self, n):
         tmpdir = mkdtemp()
         try:
-            from gams import GamsWorkspace, DebugLevel
-
-            workspace = GamsWorkspace(debug=DebugLevel.Off, working_directory=tmpdir)
+            workspace = gams.GamsWorkspace(
+                debug=gams.DebugLevel.Off, working_directory=tmpdir
+            )
             t1 = workspace.add_job_from_string(self._simple_model(n))
             t1.run()
             return True
@@ -264,11 +371,11 @@ class GAMSDirect(_GAMSSolver):
         # Make sure available() doesn't crash
         self.available()
 
-        from gams import GamsWorkspace, DebugLevel
-
+        GamsWorkspace = gams.GamsWorkspace
+        DebugLevel = gams.DebugLevel
         try:
-            from gams import GamsExceptionExecution
-        except ImportError:
+            GamsExceptionExecution = gams.GamsExceptionExecution
+        except AttributeError:
             from gams.workspace import GamsExceptionExecution
 
         if len(args) != 1:
@@ -318,7 +425,8 @@ class GAMSDirect(_GAMSSolver):
                 _called_by_solver=True,
                 **io_options,
             )
-            symbolMap = getattr(model, "._symbol_maps")[smap_id]
+            smaps = getattr(model, "._symbol_maps")
+            symbolMap = smaps[smap_id]
         else:
             _, smap_id = model.write(
                 filename=output_file, format=ProblemFormat.gams, io_options=io_options
@@ -352,6 +460,14 @@ class GAMSDirect(_GAMSSolver):
 
         t1 = workspace.add_job_from_string(output_file.getvalue())
 
+        def _release_working_files():
+            # Always name working directory or delete files,
+            # regardless of any errors.
+            if keepfiles:
+                print("\nGAMS WORKING DIRECTORY: %s\n" % workspace.working_directory)
+            elif tmpdir is not None:
+                file_removal_gams_direct(tmpdir, newdir)
+
         try:
             with OutputStream(tee=tee, logfile=logfile) as output_stream:
                 t1.run(output=output_stream)
@@ -361,27 +477,15 @@ class GAMSDirect(_GAMSSolver):
                     # Execution Error
                     check_expr_evaluation(model, symbolMap, 'direct')
             finally:
-                # Always name working directory or delete files,
-                # regardless of any errors.
-                if keepfiles:
-                    print(
-                        "\nGAMS WORKING DIRECTORY: %s\n" % workspace.working_directory
-                    )
-                elif tmpdir is not None:
-                    # Garbage collect all references to t1.out_db
-                    # So that .gdx file can be deleted
-                    t1 = rec = rec_lo = rec_hi = None
-                    file_removal_gams_direct(tmpdir, newdir)
-                raise
-        except:
-            # Catch other errors and remove files first
-            if keepfiles:
-                print("\nGAMS WORKING DIRECTORY: %s\n" % workspace.working_directory)
-            elif tmpdir is not None:
                 # Garbage collect all references to t1.out_db
                 # So that .gdx file can be deleted
-                t1 = rec = rec_lo = rec_hi = None
-                file_removal_gams_direct(tmpdir, newdir)
+                t1 = None
+                _release_working_files()
+            raise
+        except:
+            # Catch other errors and remove files first
+            t1 = None
+            _release_working_files()
             raise
 
         solve_completion_time = time.time()
@@ -418,20 +522,18 @@ class GAMSDirect(_GAMSSolver):
         results.problem.name = os.path.join(
             workspace.working_directory, t1.name + '.gms'
         )
-        results.problem.lower_bound = t1.out_db["OBJEST"].find_record().value
-        results.problem.upper_bound = t1.out_db["OBJEST"].find_record().value
-        results.problem.number_of_variables = t1.out_db["NUMVAR"].find_record().value
+        objest = t1.out_db["OBJEST"].find_record().value
+        results.problem.lower_bound = objest
+        results.problem.upper_bound = objest
+        numvar = t1.out_db["NUMVAR"].find_record().value
+        numdvar = t1.out_db["NUMDVAR"].find_record().value
+        results.problem.number_of_variables = numvar
         results.problem.number_of_constraints = t1.out_db["NUMEQU"].find_record().value
         results.problem.number_of_nonzeros = t1.out_db["NUMNZ"].find_record().value
         results.problem.number_of_binary_variables = None
         # Includes binary vars:
-        results.problem.number_of_integer_variables = (
-            t1.out_db["NUMDVAR"].find_record().value
-        )
-        results.problem.number_of_continuous_variables = (
-            t1.out_db["NUMVAR"].find_record().value
-            - t1.out_db["NUMDVAR"].find_record().value
-        )
+        results.problem.number_of_integer_variables = numdvar
+        results.problem.number_of_continuous_variables = numvar - numdvar
         results.problem.number_of_objectives = 1  # required by GAMS writer
         obj = list(model.component_data_objects(Objective, active=True))
         assert len(obj) == 1, 'Only one objective is allowed.'
@@ -450,41 +552,7 @@ class GAMSDirect(_GAMSSolver):
         results.solver.termination_condition = None
         results.solver.message = None
 
-        solvestat = t1.out_db["SOLVESTAT"].find_record().value
-        if solvestat == 1:
-            results.solver.status = SolverStatus.ok
-        elif solvestat == 2:
-            results.solver.status = SolverStatus.ok
-            results.solver.termination_condition = TerminationCondition.maxIterations
-        elif solvestat == 3:
-            results.solver.status = SolverStatus.ok
-            results.solver.termination_condition = TerminationCondition.maxTimeLimit
-        elif solvestat == 5:
-            results.solver.status = SolverStatus.ok
-            results.solver.termination_condition = TerminationCondition.maxEvaluations
-        elif solvestat == 7:
-            results.solver.status = SolverStatus.aborted
-            results.solver.termination_condition = (
-                TerminationCondition.licensingProblems
-            )
-        elif solvestat == 8:
-            results.solver.status = SolverStatus.aborted
-            results.solver.termination_condition = TerminationCondition.userInterrupt
-        elif solvestat == 10:
-            results.solver.status = SolverStatus.error
-            results.solver.termination_condition = TerminationCondition.solverFailure
-        elif solvestat == 11:
-            results.solver.status = SolverStatus.error
-            results.solver.termination_condition = (
-                TerminationCondition.internalSolverError
-            )
-        elif solvestat == 4:
-            results.solver.status = SolverStatus.warning
-            results.solver.message = "Solver quit with a problem (see LST file)"
-        elif solvestat in (9, 12, 13):
-            results.solver.status = SolverStatus.error
-        elif solvestat == 6:
-            results.solver.status = SolverStatus.unknown
+        _set_solver_status(results, t1.out_db["SOLVESTAT"].find_record().value)
 
         results.solver.return_code = 0
         # Not sure if this value is actually user time
@@ -496,74 +564,35 @@ class GAMSDirect(_GAMSSolver):
 
         soln = Solution()
 
-        modelstat = t1.out_db["MODELSTAT"].find_record().value
-        if modelstat == 1:
-            results.solver.termination_condition = TerminationCondition.optimal
-            soln.status = SolutionStatus.optimal
-        elif modelstat == 2:
-            results.solver.termination_condition = TerminationCondition.locallyOptimal
-            soln.status = SolutionStatus.locallyOptimal
-        elif modelstat in [3, 18]:
-            results.solver.termination_condition = TerminationCondition.unbounded
-            soln.status = SolutionStatus.unbounded
-        elif modelstat in [4, 5, 6, 10, 19]:
-            results.solver.termination_condition = TerminationCondition.infeasible
-            soln.status = SolutionStatus.infeasible
-        elif modelstat == 7:
-            results.solver.termination_condition = TerminationCondition.feasible
-            soln.status = SolutionStatus.feasible
-        elif modelstat == 8:
-            # 'Integer solution model found'
-            results.solver.termination_condition = TerminationCondition.optimal
-            soln.status = SolutionStatus.optimal
-        elif modelstat == 9:
-            results.solver.termination_condition = (
-                TerminationCondition.intermediateNonInteger
-            )
-            soln.status = SolutionStatus.other
-        elif modelstat == 11:
-            # Should be handled above, if modelstat and solvestat both
-            # indicate a licensing problem
-            if results.solver.termination_condition is None:
-                results.solver.termination_condition = (
-                    TerminationCondition.licensingProblems
-                )
-            soln.status = SolutionStatus.error
-        elif modelstat in [12, 13]:
-            if results.solver.termination_condition is None:
-                results.solver.termination_condition = TerminationCondition.error
-            soln.status = SolutionStatus.error
-        elif modelstat == 14:
-            if results.solver.termination_condition is None:
-                results.solver.termination_condition = TerminationCondition.noSolution
-            soln.status = SolutionStatus.unknown
-        elif modelstat in [15, 16, 17]:
-            # Having to do with CNS models,
-            # not sure what to make of status descriptions
-            results.solver.termination_condition = TerminationCondition.optimal
-            soln.status = SolutionStatus.unsure
-        else:
-            # This is just a backup catch, all cases are handled above
-            soln.status = SolutionStatus.error
+        _set_model_status(results, soln, t1.out_db["MODELSTAT"].find_record().value)
 
         soln.gap = abs(results.problem.upper_bound - results.problem.lower_bound)
 
-        for sym, obj in symbolMap.bySymbol.items():
-            if isinstance(model, IBlock):
-                # Kernel variables have no 'parent_component'
-                if obj.ctype is IObjective:
-                    soln.objective[sym] = {'Value': objctvval}
-                if obj.ctype is not IVariable:
-                    continue
-            else:
-                if obj.parent_component().ctype is Objective:
-                    soln.objective[sym] = {'Value': objctvval}
-                if obj.parent_component().ctype is not Var:
-                    continue
+        # The (single, active) objective is the only objective symbol
+        obj_sym = symbolMap.byObject.get(id(obj), None)
+        if obj_sym is not None:
+            soln.objective[obj_sym] = {'Value': objctvval}
+
+        # Collect the variable symbols (the model type is loop-invariant)
+        if isinstance(model, IBlock):
+            # Kernel variables have no 'parent_component'
+            var_syms = [
+                sym for sym, obj in symbolMap.bySymbol.items() if obj.ctype is IVariable
+            ]
+        else:
+            var_syms = [
+                sym
+                for sym, obj in symbolMap.bySymbol.items()
+                if obj.parent_component().ctype is Var
+            ]
+
+        # Local binding: called for every variable / constraint below
+        isnan = math.isnan
+        for sym in var_syms:
             rec = t1.out_db[sym].find_record()
             # obj.value = rec.level
             soln.variable[sym] = {"Value": rec.level}
-            if extract_rc and not math.isnan(rec.marginal):
+            if extract_rc and not isnan(rec.marginal):
                 # Do not set marginals to nan
                 # model.rc[obj] = rec.marginal
                 soln.variable[sym]['rc'] = rec.marginal
@@ -576,7 +605,7 @@ class GAMSDirect(_GAMSSolver):
                 sym = symbolMap.getSymbol(c)
                 if c.equality:
                     rec = t1.out_db[sym].find_record()
-                    if not math.isnan(rec.marginal):
+                    if not isnan(rec.marginal):
                         # model.dual[c] = rec.marginal
                         soln.constraint[sym] = {'dual': rec.marginal}
                     else:
@@ -594,7 +623,7 @@ class GAMSDirect(_GAMSSolver):
                     if c.upper is not None:
                         rec_hi = t1.out_db[sym + '_hi'].find_record()
                         marg += rec_hi.marginal
-                    if not math.isnan(marg):
+                    if not isnan(marg):
                         # model.dual[c] = marg
                         soln.constraint[sym] = {'dual': marg}
                     else:
@@ -604,13 +633,10 @@ class GAMSDirect(_GAMSSolver):
 
         results.solution.insert(soln)
 
-        if keepfiles:
-            print("\nGAMS WORKING DIRECTORY: %s\n" % workspace.working_directory)
-        elif tmpdir is not None:
-            # Garbage collect all references to t1.out_db
-            # So that .gdx file can be deleted
-            t1 = rec = rec_lo = rec_hi = None
-            file_removal_gams_direct(tmpdir, newdir)
+        # Garbage collect all references to t1.out_db
+        # So that .gdx file can be deleted
+        t1 = rec = rec_lo = rec_hi = None
+        _release_working_files()
 
         ####################################################################
         # Finish with results
@@ -620,9 +646,7 @@ class GAMSDirect(_GAMSSolver):
         results._smap = None
         if isinstance(model, IBlock):
             if len(results.solution) == 1:
-                results.solution(0).symbol_map = getattr(model, "._symbol_maps")[
-                    results._smap_id
-                ]
+                results.solution(0).symbol_map = symbolMap
                 results.solution(0).default_variable_value = (
                     self._default_variable_value
                 )
@@ -633,7 +657,7 @@ class GAMSDirect(_GAMSSolver):
             # see the hack in the write method
             # we don't want this to stick around on the model
             # after the solve
-            assert len(getattr(model, "._symbol_maps")) == 1
+            assert len(smaps) == 1
             delattr(model, "._symbol_maps")
             del results._smap_id
             if load_solutions and (len(results.solution) == 0):
@@ -696,6 +720,15 @@ class GAMSShell(_GAMSSolver):
         solver_exec = self.executable()
         if solver_exec is None:
             return False
+        key = (solver_exec, n)
+        if key in self._solved_simple_models:
+            return True
+        if not self._solve_simple_model(solver_exec, n):
+            return False
+        self._solved_simple_models.add(key)
+        return True
+
+    def _solve_simple_model(self, solver_exec, n):
         tmpdir = mkdtemp()
         try:
             test = os.path.join(tmpdir, 'test.gms')
@@ -787,7 +820,8 @@ class GAMSShell(_GAMSSolver):
         tmpdir=None: str
             Specify directory path for storing temporary files.
             A directory will be created if one of this name doesn't exist.
-            By default uses the system default temporary path.
+            By default uses TempfileManager.tempdir (if set) or the
+            system default temporary path.
         report_timing=False: bool
             Print timing reports for presolve, solver, postsolve, etc.
         io_options: dict
@@ -843,7 +877,9 @@ class GAMSShell(_GAMSSolver):
         # worry about the rest of the contents of that directory being deleted.
         newdir = False
         if tmpdir is None:
-            tmpdir = mkdtemp()
+            # Honor the Pyomo-wide temporary directory (e.g., a RAM-backed
+            # file system like /dev/shm), if one was set
+            tmpdir = mkdtemp(dir=TempfileManager.tempdir)
             newdir = True
         elif not os.path.exists(tmpdir):
             # makedirs creates all necessary intermediate directories in order
@@ -877,7 +913,8 @@ class GAMSShell(_GAMSSolver):
                 _called_by_solver=True,
                 **io_options,
             )
-            symbolMap = getattr(model, "._symbol_maps")[smap_id]
+            smaps = getattr(model, "._symbol_maps")
+            symbolMap = smaps[smap_id]
         else:
             _, smap_id = model.write(
                 filename=output_filename,
@@ -914,13 +951,22 @@ class GAMSShell(_GAMSSolver):
             command.append(f"lf={self._rewrite_path_win8p3(logfile)}")
 
         try:
-            ostreams = [StringIO()]
             if tee:
-                ostreams.append(sys.stdout)
-            with TeeStream(*ostreams) as t:
-                result = subprocess.run(command, stdout=t.STDOUT, stderr=t.STDERR)
+                ostreams = [StringIO(), sys.stdout]
+                with TeeStream(*ostreams) as t:
+                    result = subprocess.run(command, stdout=t.STDOUT, stderr=t.STDERR)
+                txt = ostreams[0].getvalue()
+            else:
+                # Nothing is echoed (and GAMS was told not to log to
+                # stdout): just collect whatever it prints for the error
+                # report, without the TeeStream reader threads.  The
+                # output is captured as bytes (and decoded leniently), so
+                # a non-UTF-8 message cannot mask the actual GAMS error.
+                result = subprocess.run(
+                    command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+                )
+                txt = result.stdout.decode(errors='replace')
             rc = result.returncode
-            txt = ostreams[0].getvalue()
 
             if keepfiles:
                 print("\nGAMS WORKING DIRECTORY: %s\n" % tmpdir)
@@ -938,9 +984,11 @@ class GAMSShell(_GAMSSolver):
                     "Check listing file for details."
                 )
                 logger.error(txt)
-                if os.path.exists(lst_filename):
+                # Listing files can be large: only read it if the message
+                # will actually be emitted
+                if logger.isEnabledFor(logging.ERROR) and os.path.exists(lst_filename):
                     with open(lst_filename, 'r') as FILE:
-                        logger.error("GAMS Listing file:\n\n%s" % (FILE.read(),))
+                        logger.error("GAMS Listing file:\n\n%s", FILE.read())
                 raise RuntimeError(
                     "GAMS encountered an error during solve. "
                     "Check listing file for details."
@@ -948,7 +996,7 @@ class GAMSShell(_GAMSSolver):
 
             if io_options['put_results_format'] == 'gdx':
                 model_soln, stat_vars = self._parse_gdx_results(
-                    results_filename, statresults_filename
+                    results_filename, statresults_filename, exe
                 )
             else:
                 model_soln, stat_vars = self._parse_dat_results(
@@ -1025,41 +1073,7 @@ class GAMSShell(_GAMSSolver):
         results.solver.termination_condition = None
         results.solver.message = None
 
-        solvestat = stat_vars["SOLVESTAT"]
-        if solvestat == 1:
-            results.solver.status = SolverStatus.ok
-        elif solvestat == 2:
-            results.solver.status = SolverStatus.ok
-            results.solver.termination_condition = TerminationCondition.maxIterations
-        elif solvestat == 3:
-            results.solver.status = SolverStatus.ok
-            results.solver.termination_condition = TerminationCondition.maxTimeLimit
-        elif solvestat == 5:
-            results.solver.status = SolverStatus.ok
-            results.solver.termination_condition = TerminationCondition.maxEvaluations
-        elif solvestat == 7:
-            results.solver.status = SolverStatus.aborted
-            results.solver.termination_condition = (
-                TerminationCondition.licensingProblems
-            )
-        elif solvestat == 8:
-            results.solver.status = SolverStatus.aborted
-            results.solver.termination_condition = TerminationCondition.userInterrupt
-        elif solvestat == 10:
-            results.solver.status = SolverStatus.error
-            results.solver.termination_condition = TerminationCondition.solverFailure
-        elif solvestat == 11:
-            results.solver.status = SolverStatus.error
-            results.solver.termination_condition = (
-                TerminationCondition.internalSolverError
-            )
-        elif solvestat == 4:
-            results.solver.status = SolverStatus.warning
-            results.solver.message = "Solver quit with a problem (see LST file)"
-        elif solvestat in (9, 12, 13):
-            results.solver.status = SolverStatus.error
-        elif solvestat == 6:
-            results.solver.status = SolverStatus.unknown
+        _set_solver_status(results, stat_vars["SOLVESTAT"])
 
         results.solver.return_code = rc  # 0
         # Not sure if this value is actually user time
@@ -1071,76 +1085,32 @@ class GAMSShell(_GAMSSolver):
 
         soln = Solution()
 
-        modelstat = stat_vars["MODELSTAT"]
-        if modelstat == 1:
-            results.solver.termination_condition = TerminationCondition.optimal
-            soln.status = SolutionStatus.optimal
-        elif modelstat == 2:
-            results.solver.termination_condition = TerminationCondition.locallyOptimal
-            soln.status = SolutionStatus.locallyOptimal
-        elif modelstat in [3, 18]:
-            results.solver.termination_condition = TerminationCondition.unbounded
-            soln.status = SolutionStatus.unbounded
-        elif modelstat in [4, 5, 6, 10, 19]:
-            results.solver.termination_condition = TerminationCondition.infeasible
-            soln.status = SolutionStatus.infeasible
-        elif modelstat == 7:
-            results.solver.termination_condition = TerminationCondition.feasible
-            soln.status = SolutionStatus.feasible
-        elif modelstat == 8:
-            # 'Integer solution model found'
-            results.solver.termination_condition = TerminationCondition.optimal
-            soln.status = SolutionStatus.optimal
-        elif modelstat == 9:
-            results.solver.termination_condition = (
-                TerminationCondition.intermediateNonInteger
-            )
-            soln.status = SolutionStatus.other
-        elif modelstat == 11:
-            # Should be handled above, if modelstat and solvestat both
-            # indicate a licensing problem
-            if results.solver.termination_condition is None:
-                results.solver.termination_condition = (
-                    TerminationCondition.licensingProblems
-                )
-            soln.status = SolutionStatus.error
-        elif modelstat in [12, 13]:
-            if results.solver.termination_condition is None:
-                results.solver.termination_condition = TerminationCondition.error
-            soln.status = SolutionStatus.error
-        elif modelstat == 14:
-            if results.solver.termination_condition is None:
-                results.solver.termination_condition = TerminationCondition.noSolution
-            soln.status = SolutionStatus.unknown
-        elif modelstat in [15, 16, 17]:
-            # Having to do with CNS models,
-            # not sure what to make of status descriptions
-            results.solver.termination_condition = TerminationCondition.optimal
-            soln.status = SolutionStatus.unsure
-        else:
-            # This is just a backup catch, all cases are handled above
-            soln.status = SolutionStatus.error
+        _set_model_status(results, soln, stat_vars["MODELSTAT"])
 
         soln.gap = abs(results.problem.upper_bound - results.problem.lower_bound)
 
+        # The (single, active) objective is the only objective symbol
+        obj_sym = symbolMap.byObject.get(id(obj), None)
+        if obj_sym is not None:
+            soln.objective[obj_sym] = {'Value': objctvval}
+
+        # Collect the variable symbols (the model type is loop-invariant)
+        if isinstance(model, IBlock):
+            # Kernel variables have no 'parent_component'
+            var_syms = [
+                sym for sym, obj in symbolMap.bySymbol.items() if obj.ctype is IVariable
+            ]
+        else:
+            var_syms = [
+                sym
+                for sym, obj in symbolMap.bySymbol.items()
+                if obj.parent_component().ctype is Var
+            ]
+
         has_rc_info = True
-        for sym, obj in symbolMap.bySymbol.items():
-            if isinstance(model, IBlock):
-                # Kernel variables have no 'parent_component'
-                if obj.ctype is IObjective:
-                    soln.objective[sym] = {'Value': objctvval}
-                if obj.ctype is not IVariable:
-                    continue
-            else:
-                if obj.parent_component().ctype is Objective:
-                    soln.objective[sym] = {'Value': objctvval}
-                if obj.parent_component().ctype is not Var:
-                    continue
-            try:
-                rec = model_soln[sym]
-            except KeyError:
-                # no solution returned
-                rec = (float('nan'), float('nan'))
+        for sym in var_syms:
+            # (nan, nan) if no solution was returned
+            rec = model_soln.get(sym, _NAN_PAIR)
             # obj.value = float(rec[0])
             soln.variable[sym] = {"Value": float(rec[0])}
             if extract_rc and has_rc_info:
@@ -1158,11 +1128,8 @@ class GAMSShell(_GAMSSolver):
                     continue
                 sym = symbolMap.getSymbol(c)
                 if c.equality:
-                    try:
-                        rec = model_soln[sym]
-                    except KeyError:
-                        # no solution returned
-                        rec = (float('nan'), float('nan'))
+                    # (nan, nan) if no solution was returned
+                    rec = model_soln.get(sym, _NAN_PAIR)
                     try:
                         # model.dual[c] = float(rec[1])
                         soln.constraint[sym] = {'dual': float(rec[1])}
@@ -1176,22 +1143,14 @@ class GAMSShell(_GAMSSolver):
                     # Negate marginal for _lo equations
                     marg = 0
                     if c.lower is not None:
-                        try:
-                            rec_lo = model_soln[sym + '_lo']
-                        except KeyError:
-                            # no solution returned
-                            rec_lo = (float('nan'), float('nan'))
+                        rec_lo = model_soln.get(sym + '_lo', _NAN_PAIR)
                         try:
                             marg -= float(rec_lo[1])
                         except ValueError:
                             # Solver didn't provide marginals
                             marg = float('nan')
                     if c.upper is not None:
-                        try:
-                            rec_hi = model_soln[sym + '_hi']
-                        except KeyError:
-                            # no solution returned
-                            rec_hi = (float('nan'), float('nan'))
+                        rec_hi = model_soln.get(sym + '_hi', _NAN_PAIR)
                         try:
                             marg += float(rec_hi[1])
                         except ValueError:
@@ -1215,9 +1174,7 @@ class GAMSShell(_GAMSSolver):
         results._smap = None
         if isinstance(model, IBlock):
             if len(results.solution) == 1:
-                results.solution(0).symbol_map = getattr(model, "._symbol_maps")[
-                    results._smap_id
-                ]
+                results.solution(0).symbol_map = symbolMap
                 results.solution(0).default_variable_value = (
                     self._default_variable_value
                 )
@@ -1228,7 +1185,7 @@ class GAMSShell(_GAMSSolver):
             # see the hack in the write method
             # we don't want this to stick around on the model
             # after the solve
-            assert len(getattr(model, "._symbol_maps")) == 1
+            assert len(smaps) == 1
             delattr(model, "._symbol_maps")
             del results._smap_id
             if load_solutions and (len(results.solution) == 0):
@@ -1255,24 +1212,14 @@ class GAMSShell(_GAMSSolver):
 
         return results
 
-    def _parse_gdx_results(self, results_filename, statresults_filename):
+    def _parse_gdx_results(self, results_filename, statresults_filename, exe=None):
         model_soln = dict()
-        stat_vars = dict.fromkeys(
-            [
-                'MODELSTAT',
-                'SOLVESTAT',
-                'OBJEST',
-                'OBJVAL',
-                'NUMVAR',
-                'NUMEQU',
-                'NUMDVAR',
-                'NUMNZ',
-                'ETSOLVE',
-            ]
-        )
+        stat_vars = dict.fromkeys(_STAT_VAR_NAMES)
 
+        if exe is None:
+            exe = self.executable()
         pgdx = gdxcc.new_gdxHandle_tp()
-        ret = gdxcc.gdxCreateD(pgdx, os.path.dirname(self.executable()), 128)
+        ret = gdxcc.gdxCreateD(pgdx, os.path.dirname(exe), 128)
         if not ret[0]:
             raise RuntimeError("GAMS GDX failure (gdxCreate): %s." % ret[1])
 
@@ -1293,27 +1240,20 @@ class GAMSShell(_GAMSSolver):
             )[0]
             gdxcc.gdxSetSpecialValues(pgdx, specVals)
 
-            i = 0
-            while True:
-                i += 1
-                ret = gdxcc.gdxDataReadRawStart(pgdx, i)
+            # Look the (few) status scalars up by name
+            for stat in _STAT_VAR_NAMES:
+                ret = gdxcc.gdxFindSymbol(pgdx, stat)
                 if not ret[0]:
-                    break
-
-                ret = gdxcc.gdxSymbolInfo(pgdx, i)
+                    continue
+                ret = gdxcc.gdxDataReadRawStart(pgdx, ret[1])
                 if not ret[0]:
-                    break
-                if len(ret) < 2:
-                    raise RuntimeError("GAMS GDX failure (gdxSymbolInfo).")
-                stat = ret[1]
-                if not stat in stat_vars:
                     continue
 
                 ret = gdxcc.gdxDataReadRaw(pgdx)
                 if not ret[0] or len(ret[2]) == 0:
                     raise RuntimeError("GAMS GDX failure (gdxDataReadRaw).")
 
-                if stat in ('OBJEST', 'OBJVAL', 'ETSOLVE'):
+                if stat in _FLOAT_STAT_VARS:
                     stat_vars[stat] = ret[2][0]
                 else:
                     stat_vars[stat] = int(ret[2][0])
@@ -1338,25 +1278,33 @@ class GAMSShell(_GAMSSolver):
             )[0]
             gdxcc.gdxSetSpecialValues(pgdx, specVals)
 
-            i = 0
-            while True:
-                i += 1
-                ret = gdxcc.gdxDataReadRawStart(pgdx, i)
+            # Every variable / equation is a scalar symbol holding a
+            # single record, so there is nothing to gain from the bulk
+            # (callback-based) readers.  Instead, iterate over the known
+            # symbol count and bind the GDX calls locally, as this loop
+            # runs once per model variable and constraint.
+            ret = gdxcc.gdxSystemInfo(pgdx)
+            if not ret[0]:
+                raise RuntimeError("GAMS GDX failure (gdxSystemInfo).")
+            gdxDataReadRawStart = gdxcc.gdxDataReadRawStart
+            gdxDataReadRaw = gdxcc.gdxDataReadRaw
+            gdxSymbolInfo = gdxcc.gdxSymbolInfo
+            for i in range(1, ret[1] + 1):
+                ret = gdxDataReadRawStart(pgdx, i)
                 if not ret[0]:
                     break
 
-                ret = gdxcc.gdxDataReadRaw(pgdx)
+                ret = gdxDataReadRaw(pgdx)
                 if not ret[0] or len(ret[2]) < 2:
                     raise RuntimeError("GAMS GDX failure (gdxDataReadRaw).")
-                level = ret[2][0]
-                dual = ret[2][1]
+                vals = ret[2]
 
-                ret = gdxcc.gdxSymbolInfo(pgdx, i)
+                ret = gdxSymbolInfo(pgdx, i)
                 if not ret[0]:
                     break
                 if len(ret) < 2:
                     raise RuntimeError("GAMS GDX failure (gdxSymbolInfo).")
-                model_soln[ret[1]] = (level, dual)
+                model_soln[ret[1]] = (vals[0], vals[1])
 
             gdxcc.gdxDataReadDone(pgdx)
             gdxcc.gdxClose(pgdx)
@@ -1366,27 +1314,35 @@ class GAMSShell(_GAMSSolver):
         return model_soln, stat_vars
 
     def _parse_dat_results(self, results_filename, statresults_filename):
-        with open(statresults_filename, 'r') as statresults_file:
-            statresults_text = statresults_file.read()
-
         stat_vars = dict()
-        # Skip first line of explanatory text
-        for line in statresults_text.splitlines()[1:]:
-            items = line.split()
-            try:
-                stat_vars[items[0]] = float(items[1])
-            except ValueError:
-                # GAMS printed NA, just make it nan
-                stat_vars[items[0]] = float('nan')
-
-        with open(results_filename, 'r') as results_file:
-            results_text = results_file.read()
+        with open(statresults_filename, 'r') as statresults_file:
+            # Skip first line of explanatory text
+            statresults_file.readline()
+            for line in statresults_file:
+                items = line.split()
+                try:
+                    stat_vars[items[0]] = float(items[1])
+                except ValueError:
+                    # GAMS printed NA, just make it nan
+                    stat_vars[items[0]] = float('nan')
 
         model_soln = dict()
-        # Skip first line of explanatory text
-        for line in results_text.splitlines()[1:]:
-            items = line.split()
-            model_soln[items[0]] = (items[1], items[2])
+        with open(results_filename, 'r') as results_file:
+            # Skip first line of explanatory text
+            results_file.readline()
+            # Each remaining line is "SYMBOL LEVEL MARGINAL".  Values are
+            # kept as strings, as GAMS may report non-numeric marginals
+            # (e.g., NA), which solve() interprets.
+            for line in results_file:
+                items = line.split()
+                if len(items) != 3:
+                    if not items:
+                        continue
+                    raise RuntimeError(
+                        "Unrecognized line in GAMS results file '%s': '%s'"
+                        % (results_filename, line.rstrip())
+                    )
+                model_soln[items[0]] = (items[1], items[2])
 
         return model_soln, stat_vars
 
@@ -1438,14 +1394,14 @@ class OutputStream:
 
 
 def check_expr_evaluation(model, symbolMap, solver_io):
+    # Temporarily initialize uninitialized variables in order to call
+    # value() on each expression to check domain violations
+    uninit_vars = [
+        var for var in model.component_data_objects(Var) if var.value is None
+    ]
     try:
-        # Temporarily initialize uninitialized variables in order to call
-        # value() on each expression to check domain violations
-        uninit_vars = list()
-        for var in model.component_data_objects(Var):
-            if var.value is None:
-                uninit_vars.append(var)
-                var.set_value(0, skip_validation=True)
+        for var in uninit_vars:
+            var.set_value(0, skip_validation=True)
 
         # Constraints
         for con in model.component_data_objects(Constraint, active=True):
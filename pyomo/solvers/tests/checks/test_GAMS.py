@@ -23,7 +23,7 @@ from pyomo.solvers.plugins.solvers.GAMS import GAMSShell, GAMSDirect, gdxcc_avai
 import pyomo.common.unittest as unittest
 from pyomo.common.tempfiles import TempfileManager
 from pyomo.common.tee import capture_output
-import os, shutil
+import math, os, shutil
 from tempfile import mkdtemp
 
 opt_py = SolverFactory('gams', solver_io='python')
@@ -315,6 +315,28 @@ class GAMSTests(unittest.TestCase):
         with SolverFactory("gams", solver_io="gms") as opt:
             self.assertIsNotNone(opt.version())
 
+    def test_options_string_to_dict(self):
+        ans = GAMSShell._options_string_to_dict(
+            "a=1 b=2.5 c=conopt d='x y' e=1e3 f=__import__('os')"
+        )
+        self.assertEqual(
+            ans,
+            {
+                'a': 1,
+                'b': 2.5,
+                'c': 'conopt',
+                'd': 'x y',
+                'e': 1e3,
+                'f': '__import__(os)',
+            },
+        )
+        self.assertEqual(
+            GAMSDirect._options_string_to_dict("'a=1 b=x'"), {'a': 1, 'b': 'x'}
+        )
+        self.assertEqual(GAMSDirect._options_string_to_dict("  "), {})
+        with self.assertRaisesRegex(ValueError, "option=value"):
+            GAMSDirect._options_string_to_dict("a=1 b")
+
     @unittest.skipIf(not gamsgms_available, "The 'gams' executable is not available")
     def test_dat_parser(self):
         # This tests issue 2571
@@ -337,6 +359,46 @@ class GAMSTests(unittest.TestCase):
                 res.solution[0].Variable[f'a_long_var_name_{i}_']['Value'], 1
             )
 
+    def test_parse_dat_results(self):
+        with TempfileManager:
+            tmpdir = TempfileManager.create_tempdir()
+            results = os.path.join(tmpdir, 'results.dat')
+            statresults = os.path.join(tmpdir, 'resultsstat.dat')
+            with open(results, 'w') as FILE:
+                FILE.write(
+                    "SYMBOL  :  LEVEL  :  MARGINAL\n"
+                    "x1 1.00 0.00\n"
+                    "c1_lo 10.00 NA\n"
+                    "GAMS_OBJECTIVE 10.00 0.00"
+                )
+            with open(statresults, 'w') as FILE:
+                FILE.write("SYMBOL   :   VALUE\nMODELSTAT 1.00\nOBJEST NA\n")
+            model_soln, stat_vars = GAMSShell()._parse_dat_results(results, statresults)
+        self.assertEqual(
+            model_soln,
+            {
+                'x1': ('1.00', '0.00'),
+                'c1_lo': ('10.00', 'NA'),
+                'GAMS_OBJECTIVE': ('10.00', '0.00'),
+            },
+        )
+        self.assertEqual(list(stat_vars), ['MODELSTAT', 'OBJEST'])
+        self.assertEqual(stat_vars['MODELSTAT'], 1)
+        self.assertTrue(math.isnan(stat_vars['OBJEST']))
+
+        with TempfileManager:
+            tmpdir = TempfileManager.create_tempdir()
+            results = os.path.join(tmpdir, 'results.dat')
+            statresults = os.path.join(tmpdir, 'resultsstat.dat')
+            with open(results, 'w') as FILE:
+                FILE.write("SYMBOL  :  LEVEL  :  MARGINAL\nx1 1.00\nc1_lo 10.00 NA\n")
+            with open(statresults, 'w') as FILE:
+                FILE.write("SYMBOL   :   VALUE\nMODELSTAT 1.00\n")
+            with self.assertRaisesRegex(
+                RuntimeError, "Unrecognized line in GAMS results file .*'x1 1.00'"
+            ):
+                GAMSShell()._parse_dat_results(results, statresults)
+
 
 class GAMSLogfileTestBase(unittest.TestCase):
     def setUp(self):
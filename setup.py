@@ -49,11 +49,7 @@ def check_config_arg(name):
 
 
 CYTHON_REQUIRED = "required"
-if not any(
-    arg.startswith(cmd)
-    for cmd in ('build', 'install', 'bdist', 'wheel')
-    for arg in sys.argv
-):
+if not any(arg.startswith(('build', 'install', 'bdist', 'wheel')) for arg in sys.argv):
     using_cython = False
 elif sys.version_info[:2] < (3, 11):
     using_cython = "automatic"
@@ -91,7 +87,12 @@ if using_cython:
             "pyomo/repn/plugins/ampl/ampl_.pyx",
         ]
         for f in files:
-            shutil.copyfile(f[:-1], f)
+            # Only refresh the .pyx if the .py source changed.  copy2()
+            # preserves the source mtime, so cythonize() can skip modules
+            # whose generated C is already up to date.
+            src = f[:-1]
+            if not os.path.exists(f) or os.path.getmtime(f) != os.path.getmtime(src):
+                shutil.copy2(src, f)
         ext_modules = cythonize(files, compiler_directives={"language_level": 3})
     except:
         if using_cython == CYTHON_REQUIRED:
@@ -271,6 +272,10 @@ setup_kwargs = dict(
     },
     ext_modules=ext_modules,
 )
+if ext_modules:
+    # Compile the extension modules concurrently (build_ext uses a
+    # thread pool).  An explicit -j / --parallel still takes precedence.
+    setup_kwargs['options'] = {'build_ext': {'parallel': True}}
 
 
 try: